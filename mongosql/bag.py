@@ -1,6 +1,8 @@
+import sys
 import warnings
-from itertools import chain, repeat
 from copy import copy
+from functools import lru_cache
+from operator import attrgetter
 
 from sqlalchemy import inspect, TypeDecorator
 from sqlalchemy import Column
@@ -8,10 +10,9 @@ from sqlalchemy.dialects import postgresql as pg
 from sqlalchemy.ext.associationproxy import AssociationProxy
 from sqlalchemy.ext.hybrid import hybrid_property
 
-from typing import Union, Set, Mapping, Iterable, Tuple, FrozenSet, List
+from typing import Union, Optional, Set, Mapping, Iterable, Sequence, Tuple, FrozenSet
 from sqlalchemy.ext.declarative import DeclarativeMeta
 from sqlalchemy.orm import ColumnProperty, RelationshipProperty
-from sqlalchemy.orm.attributes import InstrumentedAttribute
 from sqlalchemy.orm.base import InspectionAttr
 from sqlalchemy.orm.interfaces import MapperProperty
 from sqlalchemy.orm.strategies import DeferredColumnLoader
@@ -19,11 +20,40 @@ from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql.elements import BinaryExpression
 from sqlalchemy.sql.type_api import TypeEngine
 
-from mongosql import SA_12, SA_13
+from mongosql import SA_12
 try: from sqlalchemy.ext.associationproxy import ColumnAssociationProxyInstance  # SA 1.3.x
 except ImportError: ColumnAssociationProxyInstance = None
 
 
+class _LazyBag:
+    """ A ModelPropertyBags attribute that is initialized upon the first access
+
+    The bag is made by the named `_init_*()` method, and is stored in a slot named after the attribute: `_<name>`.
+    """
+    __slots__ = ('_init_method_name', '_slot_name')
+
+    def __init__(self, init_method_name: str):
+        self._init_method_name = init_method_name
+        self._slot_name = None
+
+    def __set_name__(self, owner: type, name: str):
+        self._slot_name = '_' + name
+
+    def __get__(self, instance: 'ModelPropertyBags', owner: type):
+        if instance is None:
+            return self
+        try:
+            return getattr(instance, self._slot_name)
+        except AttributeError:
+            bag = getattr(instance, self._init_method_name)(instance.model, inspect(instance.model))
+            setattr(instance, self._slot_name, bag)
+            return bag
+
+    def __set__(self, instance: 'ModelPropertyBags', bag: '_PropertiesBagBase'):
+        # Let subclasses put their own bags
+        setattr(instance, self._slot_name, bag)
+
+
 class ModelPropertyBags:
     """ Model Property Bags is the class that lets you get information about the model's columns.
 
@@ -41,7 +71,14 @@ class ModelPropertyBags:
     Whenever it's too much to inspect several properties, use a `CombinedBag()` over them,
     which lets you get a column from a number of bags.
     """
-    __bags_per_model_cache = {}
+    __slots__ = ('model', 'model_name',
+                 'columns', 'relations',
+                 # Lazy bags: see _LazyBag
+                 '_column_properties', '_properties', '_hybrid_properties', '_association_proxies',
+                 '_related_columns',
+                 '_pk', '_nullable', '_deferred_columns',
+                 '_writable_properties', '_writable_hybrid_properties', '_writable',
+                 '_all_names')
 
     @classmethod
     def for_model(cls, model: DeclarativeMeta) -> 'ModelPropertyBags':
@@ -51,28 +88,36 @@ class ModelPropertyBags:
         """
         # The goal of this method is to only initialize a ModelPropertyBags only once per model.
         # Previously, we used to store them inside model attributes.
-
-        try:
-            # We want ever model class to have its own ModelPropertyBags,
-            # and we want no one to inherit it.
-            # We could use model.__dict__ for this, but classes in Python 3 use an immutable `mappingproxy` instead.
-            # Thus, we have to keep our own cache of ModelPropertyBags.
-            return cls.__bags_per_model_cache[model]
-        except KeyError:
-            cls.__bags_per_model_cache[model] = bags = cls(model)
-            return bags
+        # We want ever model class to have its own ModelPropertyBags,
+        # and we want no one to inherit it.
+        # We could use model.__dict__ for this, but classes in Python 3 use an immutable `mappingproxy` instead.
+        # Thus, we have to keep our own cache of ModelPropertyBags.
+        # It's a hit nearly every time, so it's a plain dict lookup by the model: no inspect(), no exception handling
+        bags = _bags_per_model_cache.get(model, _NO_BAGS).get(cls)
+        if bags is None:
+            # Aliases are never cached: __init__() is going to complain about them. Good.
+            bags = cls(model)
+            # Every subclass of ModelPropertyBags may analyze a model differently: keep them apart
+            _bags_per_model_cache.setdefault(model, {})[cls] = bags
+        return bags
 
     @classmethod
     def for_alias(cls, aliased_model: AliasedClass) -> 'ModelPropertyBags':
         """ Get bags for an aliased class """
-        model = inspect(aliased_model).class_
-        return cls.for_model(model).aliased(aliased_model)
+        return cls.for_model(inspect(aliased_model).mapper.class_).aliased(aliased_model)
 
     @classmethod
     def for_model_or_alias(cls, target: Union[DeclarativeMeta, AliasedClass]) -> 'ModelPropertyBags':
         """ Get bags for a model, or aliased(model) """
-        if inspect(target).is_aliased_class:
-            return cls.for_alias(target)
+        # Only models are cached, so a hit means it's not an alias
+        bags = _bags_per_model_cache.get(target, _NO_BAGS).get(cls)
+        if bags is not None:
+            return bags
+
+        # Inspect only once: aliases share the bags of their model
+        ins = inspect(target)
+        if ins.is_aliased_class:
+            return cls.for_model(ins.mapper.class_).aliased(target)
         else:
             return cls.for_model(target)
 
@@ -82,44 +127,23 @@ class ModelPropertyBags:
         :param model: Model
         :type model: sqlalchemy.ext.declarative.DeclarativeMeta
         """
+        # Get the inspector
+        insp = inspect(model)
+
         # We don't tolerate aliases here
-        if inspect(model).is_aliased_class:
+        if insp.is_aliased_class:
             raise TypeError('MongoPropertyBags does not tolerate aliased() models.'
                             'If you do really need to use one, do it this way: '
                             'ModelPropertyBags.for_alias(aliased_model)')
 
-        # Get the inspector
-        insp = inspect(model)
-
         # Initialize
         self.model = model
         self.model_name = model.__name__
 
-        # Init bags: after every column type
+        # Init bags: the ones that are used all the time
+        # All other bags are initialized lazily, upon the first access: see below
         self.columns = self._init_columns(model, insp)
-        self.column_properties = self._init_column_properties(model, insp)
-        self.properties = self._init_properties(model, insp)
-        self.hybrid_properties = self._init_hybrid_properties(model, insp)
-        self.association_proxies = self._init_association_proxies(model, insp)
         self.relations = self._init_relations(model, insp)
-        self.related_columns = self._init_related_columns(model, insp)
-
-        # Additional informational bags
-        self.pk = self._init_primary_key(model, insp)
-        self.nullable = self._init_nullable_columns(model, insp)
-        self.deferred_columns = self._init_deferred_columns(model, insp)
-        self.has_deferred_columns = len(self.deferred_columns.names) > 0
-
-        # Writable entities
-        self.writable_properties = self._init_writable_properties(model, insp)
-        self.writable_hybrid_properties = self._init_writable_hybrid_properties(model, insp)
-
-        self.writable = CombinedBag(
-            # Everything that's writable in a model (excluding relations)
-            col=self.columns,
-            prop=self.writable_properties,
-            hybrid=self.writable_hybrid_properties,
-        )
 
     # region: Initialize bags
 
@@ -153,12 +177,13 @@ class ModelPropertyBags:
 
     def _init_related_columns(self, model, insp):
         #: Related column properties
-        relationships_dict = _get_model_relationships(model, insp)
-        return DotRelatedColumnsBag(relationships_dict)
+        # Reuse the relationships bag: no need to analyze relationships twice
+        return DotRelatedColumnsBag(self.relations)
 
     def _init_primary_key(self, model, insp):
         """ Initialize: Primary key columns """
         #: Primary key columns
+        # Take them from self.columns: a subclass may have analyzed the model differently
         return PrimaryKeyBag({c.name: self.columns[c.name]
                               for c in insp.primary_key})
 
@@ -177,9 +202,11 @@ class ModelPropertyBags:
 
     def _init_writable_properties(self, model, insp):
         """ Initialize: writable properties """
+        # Properties are already known: no need to getattr() them again
+        properties = self.properties
         return PropertiesBag({name: None
-                              for name in self.properties.names
-                              if _is_property_writable(getattr(model, name))})
+                              for name, prop in _get_model_properties(model, insp).items()
+                              if name in properties and _is_property_writable(prop)})
 
     def _init_writable_hybrid_properties(self, model, insp):
         """ Initialize: writable Hybrid properties """
@@ -187,6 +214,41 @@ class ModelPropertyBags:
                                     for name, prop in self.hybrid_properties
                                     if _is_property_writable(prop)})
 
+    def _init_writable(self, model, insp):
+        """ Initialize: everything that's writable in a model (excluding relations) """
+        return CombinedBag(
+            col=self.columns,
+            prop=self.writable_properties,
+            hybrid=self.writable_hybrid_properties,
+        )
+
+    # endregion
+
+    # region: Lazy bags
+
+    # Many bags are seldom used, so they're only initialized upon the first access
+
+    column_properties = _LazyBag('_init_column_properties')
+    properties = _LazyBag('_init_properties')
+    hybrid_properties = _LazyBag('_init_hybrid_properties')
+    association_proxies = _LazyBag('_init_association_proxies')
+    related_columns = _LazyBag('_init_related_columns')
+
+    # Additional informational bags
+    pk = _LazyBag('_init_primary_key')
+    nullable = _LazyBag('_init_nullable_columns')
+    deferred_columns = _LazyBag('_init_deferred_columns')
+
+    # Writable entities
+    writable_properties = _LazyBag('_init_writable_properties')
+    writable_hybrid_properties = _LazyBag('_init_writable_hybrid_properties')
+    writable = _LazyBag('_init_writable')
+
+    @property
+    def has_deferred_columns(self) -> bool:
+        """ Does the model have any deferred columns? """
+        return len(self.deferred_columns.names) > 0
+
     # endregion
 
     def aliased(self, aliased_class: AliasedClass):
@@ -194,16 +256,31 @@ class ModelPropertyBags:
         # This makes sense because we don't know which of the bags are going to be actually used,
         # and aliased() has a bit of overhead: it involves copying the whole class.
         # Benchmarks have shown that it's about 3 times faster.
-        return _MPB_LazyAliasedWrapper(self.__dict__, aliased_class)
+        return _MPB_LazyAliasedWrapper(self, aliased_class)
 
     @property
-    def all_names(self) -> Set[str]:
+    def all_names(self) -> FrozenSet[str]:
         """ Get the names of all properties defined for the model """
-        return self.columns.names | \
-               self.properties.names | \
-               self.hybrid_properties.names | \
-               self.association_proxies.names | \
-               self.relations.names
+        # Every MongoQuery asks for it, but the bags never change: only combine them once
+        try:
+            return self._all_names
+        except AttributeError:
+            self._all_names = all_names = (
+                self.columns.names |
+                self.properties.names |
+                self.hybrid_properties.names |
+                self.association_proxies.names |
+                self.relations.names
+            )
+            return all_names
+
+
+# ModelPropertyBags, initialized once per model: { model: { ModelPropertyBags class: bags } }
+# Aliases share the bags of their model: see ModelPropertyBags.for_alias()
+_bags_per_model_cache = {}
+
+# An empty dict for cache misses. Never modified.
+_NO_BAGS = {}
 
 
 class _PropertiesBagBase:
@@ -222,9 +299,10 @@ class _PropertiesBagBase:
     Since there are so many different container types, there's one, CombinedBag(), that can
     handle them all, depending on the context.
     """
+    __slots__ = ('_aliased_insp',)
 
     def __init__(self) -> None:
-        super().__init__()
+        # No super().__init__(): it's object.__init__(), which does nothing
         self._aliased_insp = None
 
     def __contains__(self, name: str) -> bool:
@@ -242,8 +320,16 @@ class _PropertiesBagBase:
     def __copy__(self) -> '_PropertiesBagBase':
         """ Copy behavior is used to make an AliasedBag """
         cls = self.__class__
-        result = cls.__new__(cls)
-        result.__dict__.update(self.__dict__)
+        result = cls.__new__(cls)  # no __init__(): attributes are copied as they are
+        # Copy slots one by one, with no intermediate dict
+        for name in _get_slot_names(cls):
+            try:
+                setattr(result, name, getattr(self, name))
+            except AttributeError:
+                pass  # not set
+        # Subclasses that don't use slots
+        if hasattr(self, '__dict__'):
+            result.__dict__.update(self.__dict__)
         return result
 
     def aliased(self, aliased_class) -> '_PropertiesBagBase':
@@ -266,15 +352,19 @@ class _PropertiesBagBase:
 
         Use this for validation.
         """
-        return set(names) - self.names
+        valid_names = self.names
+        return {name for name in names if name not in valid_names}
 
 
 class PropertiesBag(_PropertiesBagBase):
     """ Contains simple model properties (@property) """
+    __slots__ = ('_property_names', '_items')
 
-    def __init__(self, properties: Mapping[str, None]):
+    def __init__(self, properties: Mapping[str, Optional[property]]):
         super(PropertiesBag, self).__init__()
         self._property_names = frozenset(properties.keys())
+        # Properties have no values: iterate over ready-made (name, None) pairs, in a stable order
+        self._items = tuple((name, None) for name in properties.keys())
 
     @property
     def names(self) -> FrozenSet[str]:
@@ -290,11 +380,12 @@ class PropertiesBag(_PropertiesBagBase):
         raise KeyError(prop_name)
 
     def __iter__(self) -> Iterable[Tuple[str, None]]:
-        return iter(zip(self._property_names, repeat(None)))
+        return iter(self._items)
 
 
 class _ColumnLikeAttrsBagBase(_PropertiesBagBase):
     """ Bag for column-like attributes (like association proxies) """
+    __slots__ = ('_columns', '_column_names', '_items')
 
     def __init__(self, column_like_attrs: Mapping[str, InspectionAttr]):
         """ Init Association Proxies """
@@ -302,12 +393,24 @@ class _ColumnLikeAttrsBagBase(_PropertiesBagBase):
         self._columns = column_like_attrs
         self._column_names = frozenset(self._columns.keys())
 
+        # Items: materialized upon the first iteration
+        self._items = None
+
+    def aliased(self, aliased_class: AliasedClass) -> '_ColumnLikeAttrsBagBase':
+        new = super(_ColumnLikeAttrsBagBase, self).aliased(aliased_class)
+        new._items = None  # those were items of the original bag
+        return new
+
     @property
     def names(self) -> FrozenSet[str]:
         return self._column_names
 
     def __iter__(self) -> Iterable[Tuple[str, InspectionAttr]]:
-        return iter(self._columns.items())
+        # Bags never change, so we only have to collect their items once.
+        # It's done lazily because aliased bags have to adapt every column they give out.
+        if self._items is None:
+            self._items = tuple(self._columns.items())
+        return iter(self._items)
 
     def __contains__(self, name: str) -> bool:
         return name in self._column_names
@@ -333,6 +436,7 @@ class ColumnsBag(_ColumnLikeAttrsBagBase):
     - list of all columns
     - getting a column by name: bag[column_name]
     """
+    __slots__ = ('_array_column_names', '_json_column_names')
 
     def __init__(self, columns: Mapping[str, ColumnProperty]):
         """ Init columns
@@ -342,12 +446,18 @@ class ColumnsBag(_ColumnLikeAttrsBagBase):
         super(ColumnsBag, self).__init__(columns)
 
         # More info about columns based on their type
-        self._array_column_names = frozenset(name
-                                             for name, col in self._columns.items()
-                                             if _is_column_array(col))
-        self._json_column_names =  frozenset(name
-                                             for name, col in self._columns.items()
-                                             if _is_column_json(col))
+        # Only names are kept: the columns themselves are in `_columns`
+        array_column_names = []
+        json_column_names = []
+        for name, col in self._columns.items():
+            # Get the type once; ARRAY and JSON are disjoint, so arrays skip the second test
+            type_cls = type(_get_column_type(col))
+            if _is_type_array(type_cls):
+                array_column_names.append(name)
+            elif _is_type_json(type_cls):
+                json_column_names.append(name)
+        self._array_column_names = frozenset(array_column_names)
+        self._json_column_names = frozenset(json_column_names)
 
     def aliased(self, aliased_class: AliasedClass):
         return DictOfAliasedColumns.aliased_attrs(
@@ -367,20 +477,29 @@ class ColumnsBag(_ColumnLikeAttrsBagBase):
 
 class HybridPropertiesBag(ColumnsBag):
     """ Contains hybrid properties of a model """
+    __slots__ = ()
 
     class _Hack_Lazy_Dict:
-        """ A Lazy dict that only loads its keys upon request """
-        __slots__ = ('_l', '_ks')
+        """ A Lazy dict that only loads its keys upon request
+
+        Every key is loaded only once: the values never change for the same alias.
+        """
+        __slots__ = ('_l', '_ks', '_cache')
 
         def __init__(self, keys, lambda_value):
             self._ks = keys
             self._l = lambda_value
+            self._cache = {}
 
         def __getitem__(self, key):
-            return self._l(key)
+            try:
+                return self._cache[key]
+            except KeyError:
+                self._cache[key] = value = self._l(key)
+                return value
 
         def items(self):
-            return ((k, self._l(k))
+            return ((k, self[k])
                     for k in self._ks)
 
     def aliased(self, aliased_class: AliasedClass) -> 'HybridPropertiesBag':
@@ -408,6 +527,7 @@ class PrimaryKeyBag(ColumnsBag):
 
     Like ColumnBag, but with a fancy name :)
     """
+    __slots__ = ()
 
 
 class DotColumnsBag(ColumnsBag):
@@ -415,21 +535,44 @@ class DotColumnsBag(ColumnsBag):
 
         - For JSON fields: field.prop.prop -- dot-notation access to sub-properties
     """
+    __slots__ = ('_json_paths',)
+
+    def __init__(self, columns: Mapping[str, ColumnProperty]):
+        super(DotColumnsBag, self).__init__(columns)
+
+        #: Resolved JSON paths: 'json_column.property.property' => SQL expression
+        self._json_paths = {}
+
+    def aliased(self, aliased_class: AliasedClass) -> 'DotColumnsBag':
+        new = super(DotColumnsBag, self).aliased(aliased_class)
+        # Expressions of the original model are no good for an alias
+        new._json_paths = {}
+        return new
 
     def __contains__(self, name: str) -> bool:
-        column_name, path = _dot_notation(name)
-        return super(DotColumnsBag, self).__contains__(column_name)
+        return super(DotColumnsBag, self).__contains__(get_plain_column_name(name))
 
     def __getitem__(self, name: str) -> Union[ColumnProperty, BinaryExpression]:
+        # Plain column: the most common case. Go straight to the dict; no super() call
+        if '.' not in name:
+            return self._columns[name]
+
+        # JSON path: building an expression is expensive, so we reuse them
+        expr = self._json_paths.get(name)
+        if expr is not None:
+            return expr
+
+        # Only split the name when it's seen for the first time
         column_name, path = _dot_notation(name)
-        col = super(DotColumnsBag, self).__getitem__(column_name)
-        # JSON path
-        if path:
-            if self.is_column_json(column_name):
-                col = col[path].astext
-            else:
-                raise KeyError(name)
-        return col
+        # Not a JSON column. For models without any JSON columns, every dot-notation name ends up here
+        if column_name not in self._json_column_names:
+            raise KeyError(name)
+        expr = self._columns[column_name][path.split('.')].astext
+
+        # JSON paths come from the user, so don't let the cache grow indefinitely
+        if len(self._json_paths) < _JSON_PATHS_CACHE_SIZE:
+            self._json_paths[name] = expr
+        return expr
 
     def get_column_name(self, name: str) -> str:
         """ Get a column name, not a JSON path """
@@ -440,19 +583,20 @@ class DotColumnsBag(ColumnsBag):
         return self[get_plain_column_name(name)]
 
     def get_invalid_names(self, names: Iterable[str]) -> Set[str]:
-        # First, validate easy names
-        invalid = super(DotColumnsBag, self).get_invalid_names(names)  #type: set
-        # Next, among those invalid ones, give those with dot-notation a second change: they
-        # might be JSON columns' fields!
-        invalid -= {name
-                    for name in invalid
-                    if self.is_column_json(name)
-                    }
-        return invalid
+        # Easy names are checked first; those with dot-notation get a second chance:
+        # they might be JSON columns' fields!
+        column_names = self._column_names
+        json_column_names = self._json_column_names
+        return {name
+                for name in names
+                if name not in column_names
+                and name.partition('.')[0] not in json_column_names
+                }
 
 
 class AssociationProxiesBag(_ColumnLikeAttrsBagBase):
     """ Bag for Association Proxies """
+    __slots__ = ()
 
     # Implement those two methods so that it looks like a column
 
@@ -483,6 +627,7 @@ class RelationshipsBag(_PropertiesBagBase):
 
     Keeps track of relationships of a model.
     """
+    __slots__ = ('_relations', '_rel_names', '_array_rel_names', '_items')
 
     def __init__(self, relationships: Mapping[str, RelationshipProperty]):
         """ Init relationships
@@ -490,17 +635,28 @@ class RelationshipsBag(_PropertiesBagBase):
         """
         super(RelationshipsBag, self).__init__()
         self._relations = relationships
-        self._rel_names = frozenset(self._relations.keys())
-        self._array_rel_names = frozenset(name
-                                          for name, rel in self._relations.items()
-                                          if _is_relationship_array(rel))
+
+        # Both sets are collected in a single pass
+        rel_names = []
+        array_rel_names = []
+        for name, rel in self._relations.items():
+            rel_names.append(name)
+            if _is_relationship_array(rel):
+                array_rel_names.append(name)
+        self._rel_names = frozenset(rel_names)
+        self._array_rel_names = frozenset(array_rel_names)
+
+        # Items: materialized upon the first iteration
+        self._items = None
 
     def aliased(self, aliased_class: AliasedClass) -> 'RelationshipsBag':
-        return DictOfAliasedColumns.aliased_attrs(
+        new = DictOfAliasedColumns.aliased_attrs(
             aliased_class,
             super(RelationshipsBag, self).aliased(aliased_class),
             '_relations'
         )
+        new._items = None  # those were items of the original bag
+        return new
 
     def is_relationship_array(self, name: str) -> bool:
         """ Is the relationship an array relationship? """
@@ -513,7 +669,10 @@ class RelationshipsBag(_PropertiesBagBase):
 
     def __iter__(self) -> Iterable[Tuple[str, RelationshipProperty]]:
         """ Get relationships """
-        return iter(self._relations.items())
+        # Collected once, lazily: see _ColumnLikeAttrsBagBase.__iter__()
+        if self._items is None:
+            self._items = tuple(self._relations.items())
+        return iter(self._items)
 
     def __contains__(self, name: str) -> bool:
         return name in self._relations
@@ -528,30 +687,33 @@ class RelationshipsBag(_PropertiesBagBase):
 
 class DotRelatedColumnsBag(ColumnsBag):
     """ Relationships bag that supports dot-notation for referencing columns of a related model """
+    __slots__ = ('_rel_bag',)
 
-    def __init__(self, relationships: Mapping[str, ColumnProperty]):
-        self._rel_bag = RelationshipsBag(relationships)
+    def __init__(self, relationships: Union[RelationshipsBag, Mapping[str, RelationshipProperty]]):
+        """ Init related columns
+
+        :param relationships: Model relationships, or a RelationshipsBag that already has them
+        """
+        if not isinstance(relationships, RelationshipsBag):
+            relationships = RelationshipsBag(relationships)
+        self._rel_bag = relationships
 
         #: Dot-notation mapped to columns: 'rel.col' => Column
         related_columns = {}
-        #: Dot-notation mapped to target models: 'rel.col' => Model, and 'rel' => Model
-        rel_col_2_model = {}
 
         # Collect columns from every relation
-        for rel_name, relation in self._rel_bag:
+        for rel_name, relation in self._rel_bag._relations.items():
             # Get the model
-            model = relation.property.mapper.class_
-            rel_col_2_model[rel_name] = model
+            ins = relation.property.mapper
+            model = ins.class_
 
             # Get the columns
-            ins = inspect(model)
             cols = _get_model_columns(model, ins)  # TODO: support more attr types? hybrid? association proxy?
 
             # Remember all of them, using dot-notation
-            for col_name, col in cols.items():
-                key = '{}.{}'.format(rel_name, col_name)
-                related_columns[key] = col
-                rel_col_2_model[key] = model
+            # The names are interned: every related column name is a brand new string
+            related_columns.update({sys.intern(f'{rel_name}.{col_name}'): col
+                                    for col_name, col in cols.items()})
 
         # Now, when we have enough information, call super().__init__
         # It will initialize:
@@ -562,14 +724,11 @@ class DotRelatedColumnsBag(ColumnsBag):
         # Keep in mind that all of them are RELATED COLUMNS
         super(DotRelatedColumnsBag, self).__init__(related_columns)
 
-        #: A mapping of related column names to target models
-        #self._column_name_to_related_model = rel_col_2_model  # unused
-
     def aliased(self, aliased_class: AliasedClass) -> 'DotRelatedColumnsBag':
         new = DictOfAliasedColumns.aliased_attrs(
             aliased_class,
             super(DotRelatedColumnsBag, self).aliased(aliased_class),
-            '_columns', #'_column_name_to_related_model',
+            '_columns',
         )
         new._rel_bag = new._rel_bag.aliased(aliased_class)
         return new
@@ -583,10 +742,10 @@ class DotRelatedColumnsBag(ColumnsBag):
         return name in self._json_column_names
 
     def get_relationship_name(self, col_name: str) -> str:
-        return _dot_notation(col_name)[0]
+        return get_plain_column_name(col_name)
 
     def get_related_column_name(self, col_name: str) -> str:
-        return _dot_notation(col_name)[1]
+        return col_name.partition('.')[2]
 
     def get_relationship(self, col_name: str) -> RelationshipProperty:
         return self._rel_bag[self.get_relationship_name(col_name)]
@@ -606,6 +765,7 @@ class FakeBag(_PropertiesBagBase):
 
         This is used to support legacy columns. They are assumed to support dot-notation.
     """
+    __slots__ = ('_fake_columns', '_fake_column_names')
 
     def __init__(self, fake_columns: Mapping[str, None]):
         super(FakeBag, self).__init__()
@@ -657,20 +817,23 @@ class CombinedBag(_PropertiesBagBase):
 
     This way, you can always tell which bag has the column come from, and handle it appropriately.
     """
+    __slots__ = ('_bags', '_names', '_items', '_bag_lookup_by_column_name', '_resolved', '_json_column_names')
 
     def __init__(self, **bags):
         super(CombinedBag, self).__init__()
         self._bags = bags
 
-        # Combined names from all bags
-        self._names = frozenset(chain(*(bag.names for bag in bags.values())))
+        # Combined items from all bags: materialized upon the first iteration
+        self._items = None
 
         # Combined lookup by name from all bags
-        self._bag_name_lookup_by_column_name = {
-            column_name: bag_name
-            for bag_name, bag  in self._bags.items()
-            for column_name, column in bag
-        }
+        self._bag_lookup_by_column_name = self._make_bag_lookup(self._bags)
+
+        # Combined names from all bags
+        self._names = frozenset(self._bag_lookup_by_column_name)
+
+        # Resolved items: name => (bag name, bag, column). Filled upon access
+        self._resolved = {}
 
         # List of JSON columnstests/t2_handlers_test.py:1115
         json_column_names = []
@@ -689,44 +852,65 @@ class CombinedBag(_PropertiesBagBase):
         # aliased() on every bag
         new._bags = {name: bag.aliased(aliased_class)
                      for name, bag in self._bags.items()}
+        new._items = None  # those were items of the original bags
+        new._bag_lookup_by_column_name = new._make_bag_lookup(new._bags)
+        new._resolved = {}
         return new
 
+    @staticmethod
+    def _make_bag_lookup(bags: Mapping[str, _PropertiesBagBase]) -> Mapping[str, Tuple[str, _PropertiesBagBase]]:
+        """ Make a lookup: column name => (bag name, bag)
+
+            When a name is present in multiple bags, the last bag wins.
+        """
+        return {column_name: (bag_name, bag)
+                for bag_name, bag in bags.items()
+                for column_name in bag.names}
+
     def bag(self, name) -> _PropertiesBagBase:
         """ Get a specific bag by name """
         return self._bags[name]
 
     def __contains__(self, name: str) -> bool:
-        # Simple
-        if name in self._names:
+        # Simple: a single lookup
+        if name in self._bag_lookup_by_column_name:
             return True
-        # It might be a JSON column. Try it
-        if get_plain_column_name(name) in self._json_column_names:
-            return True
-        # Nope. Nothing worked
-        return False
+        # It might be a JSON column. Only names that missed pay for splitting
+        return name.partition('.')[0] in self._json_column_names
 
     def __getitem__(self, name: str) -> Tuple[str, _PropertiesBagBase, MapperProperty]:
-        # Get the column name: remove the '.'-notation only if the column is a json column
-        plain_name = get_plain_column_name(name)
-        plain_name = plain_name if plain_name in self._json_column_names else name
+        # Seen before?
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+
         # Locate the bag by quick lookup
-        bag_name = self._bag_name_lookup_by_column_name[plain_name]
-        # Get the column
-        bag = self._bags[bag_name]
-        # Done
-        return (bag_name, bag, bag[name])
+        found = self._bag_lookup_by_column_name.get(name)
+        if found is None:
+            # It might be a JSON column with dot-notation: remove the '.'-notation
+            plain_name = get_plain_column_name(name)
+            if plain_name not in self._json_column_names:
+                raise KeyError(name)
+            # Not remembered here: JSON paths come from the user. The bag takes care of them.
+            bag_name, bag = self._bag_lookup_by_column_name[plain_name]
+            return (bag_name, bag, bag[name])
+
+        # Remember it: there's only as many of those as there are names
+        bag_name, bag = found
+        self._resolved[name] = resolved = (bag_name, bag, bag[name])
+        return resolved
 
     def get_invalid_names(self, names: Iterable[str]) -> Set[str]:
-        # This method is copy-paste from ColumnsBag
-        # First, validate easy names
-        invalid = super(CombinedBag, self).get_invalid_names(names)  # type: set
-        # Next, among those invalid ones, give those with dot-notation a second change: they
-        # might be JSON columns' fields!
-        invalid -= {name
-                    for name in invalid
-                    if get_plain_column_name(name) in self._json_column_names
-                    }
-        return invalid
+        # This method is copy-paste from DotColumnsBag
+        # Easy names are checked first; those with dot-notation get a second chance:
+        # they might be JSON columns' fields!
+        bag_lookup = self._bag_lookup_by_column_name
+        json_column_names = self._json_column_names
+        return {name
+                for name in names
+                if name not in bag_lookup
+                and name.partition('.')[0] not in json_column_names
+                }
 
     def get(self, name: str) -> MapperProperty:
         """ Get a property """
@@ -737,31 +921,66 @@ class CombinedBag(_PropertiesBagBase):
         return self._names
 
     def __iter__(self) -> Iterable[Tuple[str, _PropertiesBagBase, str, MapperProperty]]:
-        return (
-            (bag_name, bag, column_name, column)
-            for bag_name, bag in self._bags.items()
-            for column_name, column in bag
-        )
+        # Bags never change, so we only have to collect their items once.
+        # It's done lazily because aliased bags have to adapt every column they give out.
+        if self._items is None:
+            self._items = tuple(
+                (bag_name, bag, column_name, column)
+                for bag_name, bag in self._bags.items()
+                for column_name, column in bag
+            )
+        return iter(self._items)
 
 
 def _get_model_columns(model, ins):
-    """ Get a dict of model columns. Only columns. """
-    return {name: getattr(model, name)
-            for name, c in ins.column_attrs.items()
-            # NOTE: for backwards compatibility, we cannot now exlude underscored properties
-            # because they are sometimes mentioned in `bundled_project` and are therefore in use
-            # if not name.startswith('_')
-            if isinstance(c.expression, Column)  # exclude column properties (SQL expressions)
-            }
+    """ Get a dict of model columns. Only columns.
+
+    The result is cached per mapper and is shared: don't modify it!
+    """
+    return _get_model_column_attrs(model, ins)[0]
 
 
 def _get_model_column_properties(model, ins):
     """ Get a dict of model column properties """
-    return {name: getattr(model, name)
-            for name, c in ins.column_attrs.items()
-            if not name.startswith('_') and
-               not isinstance(c.expression, Column)  # non-column attributes like SQL expressions
-            }
+    return _get_model_column_attrs(model, ins)[1]
+
+
+def _get_model_column_attrs(model, ins) -> Tuple[dict, dict]:
+    """ Get dicts of model columns and column properties
+
+    Both are found among `column_attrs`, so we walk it only once.
+    The result is cached per mapper and is shared: don't modify it!
+    """
+    # Models often reference the same model many times: every relationship brings its columns.
+    # Only analyze every mapper once.
+    try:
+        return _model_column_attrs_cache[ins]
+    except KeyError:
+        pass
+
+    column_names = []
+    column_property_names = []
+    for name, c in ins.column_attrs.items():
+        if isinstance(c.expression, Column):
+            # Names are interned: they're looked up in dicts and sets with every query
+            # NOTE: for backwards compatibility, we cannot now exlude underscored properties
+            # because they are sometimes mentioned in `bundled_project` and are therefore in use
+            column_names.append(sys.intern(name))
+        elif not name.startswith('_'):
+            # non-column attributes like SQL expressions
+            column_property_names.append(name)
+
+    _model_column_attrs_cache[ins] = column_attrs = (
+        dict(zip(column_names, _get_attributes_by_name(model, column_names))),
+        dict(zip(column_property_names, _get_attributes_by_name(model, column_property_names))),
+    )
+    return column_attrs
+
+
+# Model columns and column properties, analyzed once per mapper. See: _get_model_column_attrs()
+# A plain dict: the cached attributes reference the mapper anyway, so weak keys would never let go of it
+_model_column_attrs_cache = {}
+
 
 def _get_model_association_proxies(model, ins):
     """ Get a dict of model association_proxy attributes """
@@ -770,51 +989,116 @@ def _get_model_association_proxies(model, ins):
         warnings.warn('MongoSQL only supports AssociationProxy columns with SqlAlchemy 1.3.x')
         return {}
 
-    return {name: getattr(model, name)
-            for name, c in ins.all_orm_descriptors.items()
-            if not name.startswith('_')
-            and isinstance(c, AssociationProxy)}
+    return _get_model_orm_descriptors(model, ins)[1]
 
 
 def _get_model_hybrid_properties(model, ins):
     """ Get a dict of model hybrid properties """
-    return {name: getattr(model, name)
-            for name, c in ins.all_orm_descriptors.items()
-            if not name.startswith('_')
-            and isinstance(c, hybrid_property)}
+    return _get_model_orm_descriptors(model, ins)[0]
+
+
+def _get_model_orm_descriptors(model, ins) -> Tuple[dict, dict]:
+    """ Get dicts of model hybrid properties and association proxies
+
+    Both are found among `all_orm_descriptors`, so we walk it only once.
+    The result is cached per mapper and is shared: don't modify it!
+    """
+    descriptors = _model_orm_descriptors_cache.get(ins)
+    if descriptors is None:
+        hybrid_properties = {}
+        association_proxies = {}
+        for name, c in ins.all_orm_descriptors.items():
+            if name.startswith('_'):
+                continue
+            if isinstance(c, hybrid_property):
+                hybrid_properties[name] = getattr(model, name)
+            elif isinstance(c, AssociationProxy):
+                association_proxies[name] = getattr(model, name)
+        _model_orm_descriptors_cache[ins] = descriptors = (hybrid_properties, association_proxies)
+    return descriptors
+
+
+# Hybrid properties and association proxies, analyzed once per mapper. See: _get_model_orm_descriptors()
+# A plain dict: the cached attributes reference the mapper anyway, so weak keys would never let go of it
+_model_orm_descriptors_cache = {}
 
 
 def _get_model_properties(model, ins):
-    """ Get a dict of model properties (calculated properties) """
-    return {name: None  # we don't need the property itself
-            for name in dir(model)
-            if not name.startswith('_')
-            and isinstance(getattr(model, name), property)}
+    """ Get a dict of model properties (calculated properties)
+
+    The result is cached per mapper and is shared: don't modify it!
+    """
+    try:
+        return _model_properties_cache[ins]
+    except KeyError:
+        pass
+
+    # Walk the class dicts along the MRO, rather than getattr() every name that dir() gives:
+    # that would invoke every descriptor of the model, including SqlAlchemy's instrumented attributes.
+    # The first class that defines a name wins, just like with attribute lookup.
+    seen = set()
+    properties = {}
+    for klass in model.__mro__:
+        for name, value in vars(klass).items():
+            if name in seen:
+                continue
+            seen.add(name)
+            if not name.startswith('_') and isinstance(value, property):
+                properties[name] = value
+
+    _model_properties_cache[ins] = properties = {name: properties[name]
+                                                 for name in sorted(properties)}  # same order as dir()
+    return properties
+
+
+# Model properties, found once per mapper. See: _get_model_properties()
+# A plain dict, like the other per-mapper caches: models live as long as the process anyway
+_model_properties_cache = {}
 
 
 def _get_model_relationships(model, ins):
     """ Get a dict of model relationships """
-    return {name: getattr(model, name)
-            for name, c in ins.relationships.items()}
+    # The class manager has the very same InstrumentedAttributes that getattr(model, name) would return.
+    # Not prop.class_attribute: for inherited relationships, it would give the attribute of the parent class.
+    class_manager = ins.class_manager
+    return {sys.intern(name): class_manager[name]
+            for name in ins.relationships.keys()}
 
 
 def _get_column_type(col: MapperProperty) -> TypeEngine:
     """ Get column's SQL type """
-    if isinstance(col.type, TypeDecorator):
+    # Read it only once: on an InstrumentedAttribute, `.type` is resolved through a chain of proxies
+    type_ = col.type
+    if isinstance(type_, TypeDecorator):
         # Type decorators wrap other types, so we have to handle them carefully
-        return col.type.impl
+        return type_.impl
     else:
-        return col.type
+        return type_
 
 
 def _is_column_array(col: MapperProperty) -> bool:
     """ Is the column a PostgreSql ARRAY column? """
-    return isinstance(_get_column_type(col), pg.ARRAY)
+    return _is_type_array(type(_get_column_type(col)))
 
 
 def _is_column_json(col: MapperProperty) -> bool:
     """ Is the column a PostgreSql JSON column? """
-    return isinstance(_get_column_type(col), (pg.JSON, pg.JSONB))
+    return _is_type_json(type(_get_column_type(col)))
+
+
+# Models have lots of columns, but only a handful of different column types.
+# Only test every type class once: this saves us from walking type hierarchies over and over again.
+
+@lru_cache(None)
+def _is_type_array(type_cls: type) -> bool:
+    """ Is the SQL type class a PostgreSql ARRAY type? """
+    return issubclass(type_cls, pg.ARRAY)
+
+
+@lru_cache(None)
+def _is_type_json(type_cls: type) -> bool:
+    """ Is the SQL type class a PostgreSql JSON type? """
+    return issubclass(type_cls, (pg.JSON, pg.JSONB))
 
 
 def _is_relationship_array(rel: RelationshipProperty) -> bool:
@@ -822,25 +1106,67 @@ def _is_relationship_array(rel: RelationshipProperty) -> bool:
     return rel.property.uselist
 
 
+# How many JSON path expressions a DotColumnsBag would remember
+_JSON_PATHS_CACHE_SIZE = 1000
+
+# How many names with dot-notation get_plain_column_name() would remember
+_DOT_NOTATION_CACHE_SIZE = 4096
+
+
 def _is_property_writable(prop: property) -> bool:
     """ Check if a property is writable """
     return prop.fset is not None
 
 
-def _dot_notation(name: str) -> Tuple[str, List[str]]:
+def _dot_notation(name: str) -> Tuple[str, str]:
     """ Split a property name that's using dot-notation.
 
     This is used to navigate the internals of JSON types:
 
-        "json_column.property.property"
+        "json_column.property.property" -> ("json_column", "property.property")
+
+    The path is an empty string when there's no dot-notation.
     """
-    path = name.split('.')
-    return path[0], path[1:]
+    column_name, _, path = name.partition('.')
+    return column_name, path
 
 
+# Plain column names are taken over and over again, but only a limited number of names is ever used.
+# The results are memoized; the cache is bounded because the names come from the user.
+@lru_cache(_DOT_NOTATION_CACHE_SIZE)
 def get_plain_column_name(name: str) -> str:
     """ Get a plain column name, dropping any dot-notation that may follow """
-    return name.split('.')[0]
+    return name.partition('.')[0]
+
+
+def _get_attributes_by_name(obj: object, names: Sequence[str]) -> Tuple:
+    """ Get multiple attributes of an object at once """
+    if not names:
+        return ()
+    values = attrgetter(*names)(obj)
+    # attrgetter() with a single name returns the value itself, not a tuple
+    return values if len(names) > 1 else (values,)
+
+
+def _get_attributes(obj: object) -> dict:
+    """ Get all attributes of an object: both from __slots__ and from __dict__ (for subclasses that don't use slots) """
+    attrs = {}
+    for name in _get_slot_names(type(obj)):
+        try:
+            attrs[name] = getattr(obj, name)
+        except AttributeError:
+            pass  # not set
+    attrs.update(getattr(obj, '__dict__', {}))
+    return attrs
+
+
+@lru_cache(None)
+def _get_slot_names(cls: type) -> Tuple[str]:
+    """ Get the names of all __slots__ of a class, including the parent classes """
+    return tuple(name
+                 for klass in cls.__mro__
+                 for name in klass.__dict__.get('__slots__', ())
+                 if name not in ('__dict__', '__weakref__'))
 
 
 class DictOfAliasedColumns:
@@ -902,7 +1228,8 @@ class DictOfAliasedColumns:
 
 class _MPB_LazyAliasedWrapper:
     """ A ModelPropertyBags wrapper that will lazily apply aliased() on every attribute upon access """
-    def __init__(self, mpb_dict: dict, aliased_class: AliasedClass):
+    def __init__(self, mpb: ModelPropertyBags, aliased_class: AliasedClass):
+        self.__mpb = mpb
         self.__aliased_class = aliased_class
 
         # Remember those attributes that were not aliased() yet
@@ -911,19 +1238,24 @@ class _MPB_LazyAliasedWrapper:
         # Tell attributes apart:
         # set the bags aside for later aliased()ing,
         # but put all other attributes onto ourselves
-        for k, v in mpb_dict.items():
+        for k, v in _get_attributes(mpb).items():
             if isinstance(v, _PropertiesBagBase):
-                self.__unaliased[k] = mpb_dict[k]
+                self.__unaliased[k] = v
             else:
                 setattr(self, k, v)  # onto ourselves
 
     def __getattr__(self, attr: str):
+        try:
+            value = self.__unaliased.pop(attr)
+        except KeyError:
+            # Lazy bags, or attributes that aren't bags at all: get them from the original
+            value = getattr(self.__mpb, attr)
+
         # Initialize a new attribute that's aliased()
-        setattr(self,
-                attr,
-                self.__unaliased.pop(attr).aliased(self.__aliased_class)
-                )
+        if isinstance(value, _PropertiesBagBase):
+            value = value.aliased(self.__aliased_class)
+        setattr(self, attr, value)
 
         # return it
-        return getattr(self, attr)
+        return value
 
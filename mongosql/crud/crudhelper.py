@@ -8,7 +8,6 @@ CRUD controllers are extremely easy to build.
 """
 
 from sqlalchemy.orm import Query
-from sqlalchemy.orm.attributes import flag_modified
 
 from mongosql import exc
 from mongosql import MongoQuery, ModelPropertyBags
@@ -109,10 +108,16 @@ class CrudHelper:
 
             :raises exc.InvalidColumnError: Invalid column name
         """
-        unk_cols = self.bags.columns.get_invalid_names(column_names)
-        if unk_cols:
-            raise exc.InvalidColumnError(self.bags.model_name, unk_cols.pop(), where)
-        return set(column_names)
+        column_names = set(column_names)
+        columns = self.bags.columns
+
+        # Fast path: plain column names only.
+        # Only go into a detailed check (with JSON dot-notation, etc) when there's something unknown
+        if not columns.names.issuperset(column_names):
+            unk_cols = columns.get_invalid_names(column_names)
+            if unk_cols:
+                raise exc.InvalidColumnError(self.bags.model_name, unk_cols.pop(), where)
+        return column_names
 
     def _validate_attributes(self, column_names: Iterable[str], where: str) -> Set[str]:
         """ Validate attribute names (any, inc. properties)
@@ -120,8 +125,9 @@ class CrudHelper:
             :raises exc.InvalidColumnError: Invalid column name
         """
         column_names = set(column_names)
-        unk_cols = column_names - self.bags.all_names
-        if unk_cols:
+        all_names = self.bags.all_names
+        if not all_names.issuperset(column_names):
+            unk_cols = column_names - all_names
             raise exc.InvalidColumnError(self.bags.model_name, unk_cols.pop(), where)
         return column_names
 
@@ -134,9 +140,10 @@ class CrudHelper:
             :rtype: set[set]
         """
         attr_names = set(attr_names)
-        unk_cols = attr_names - self.bags.writable.names
-        if unk_cols:
-            raise exc.InvalidColumnError(self.bags.model_name, unk_cols.pop(), where)
+        writable_names = self.bags.writable.names
+        for name in attr_names:
+            if name not in writable_names:
+                raise exc.InvalidColumnError(self.bags.model_name, name, where)
         return attr_names
 
     def validate_incoming_entity_dict_fields(self, entity_dict: dict, action: str) -> dict:
@@ -177,8 +184,19 @@ class CrudHelper:
 
     def _remove_entity_dict_fields(self, entity_dict: MutableMapping, rm_fields: Set[str]):
         """ Remove certain fields from the incoming entity dict """
-        for k in set(entity_dict.keys()) & rm_fields:
-            entity_dict.pop(k)
+        # Nothing to remove (e.g. no legacy fields): the most common case
+        if not rm_fields:
+            return
+
+        # Collect the keys first: can't delete while iterating.
+        # Iterate over whichever side is smaller.
+        if len(entity_dict) <= len(rm_fields):
+            rm_keys = [k for k in entity_dict if k in rm_fields]
+        else:
+            rm_keys = [k for k in rm_fields if k in entity_dict]
+
+        for k in rm_keys:
+            del entity_dict[k]
 
     def create_model(self, entity_dict: Mapping) -> object:
         """ Create an instance from entity dict.
@@ -234,12 +252,13 @@ class CrudHelper:
             This method does not validate `entity_dict`
         """
         # Update
+        is_column_json = self.bags.columns.is_column_json
         for name, val in entity_dict.items():
-            if isinstance(val, Mapping) and self.bags.columns.is_column_json(name):
-                # JSON column with a dict: do a shallow merge
-                getattr(instance, name).update(val)
-                # Tell SqlAlchemy that a mutable collection was updated
-                flag_modified(instance, name)
+            if isinstance(val, Mapping) and is_column_json(name):
+                # JSON column with a dict: do a shallow merge.
+                # Assign a new dict rather than updating the current one in-place:
+                # SqlAlchemy sees the change without flag_modified(), and the value it has loaded stays intact.
+                setattr(instance, name, {**(getattr(instance, name) or {}), **val})
             else:
                 # Other columns: just assign
                 setattr(instance, name, val)
@@ -9,7 +9,7 @@ from ..query import MongoQuery
 from ..util.history_proxy import ModelHistoryProxy
 from .crudhelper import CrudHelper, StrictCrudHelper
 
-from typing import Iterable, Mapping, Set, Union, Tuple, Callable, List
+from typing import Iterable, Mapping, Set, Union, Tuple, Callable
 from sqlalchemy.orm import Query, Session, object_session
 
 
@@ -52,6 +52,10 @@ class CrudViewMixin:
     #: Remember that every time you use ensure_loaded() on a relationship, you disable filtering for it!
     ensure_loaded = ()
 
+    #: Does _method_update() have to provide the previous version of the instance?
+    #: Every subclass gets it re-computed by __init_subclass__()
+    _needs_prev_instance = True
+
     def __init__(self):
         #: The MongoQuery for this request, if it was indeed initialized by _mquery()
         self.__mongoquery = None  # type: MongoQuery
@@ -63,6 +67,14 @@ class CrudViewMixin:
         #: The list of all `@saves_relations()` fields
         cls._saves_relations_names = saves_relations.all_relation_names_from(cls)
 
+        # ModelHistoryProxy is not cheap, so it's only made when something can actually use it:
+        # a custom _save_hook(), a @saves_relations handler, or a custom relationship saver.
+        cls._needs_prev_instance = (
+            bool(cls._saves_relations_names) or
+            cls._save_hook is not CrudViewMixin._save_hook or
+            cls._handle_saving_relationships is not CrudViewMixin._handle_saving_relationships
+        )
+
     # region Abstract Methods
 
     def _get_db_session(self) -> Session:
@@ -176,8 +188,7 @@ class CrudViewMixin:
             # zip() column names together with the values,
             # and make it into a dict
             return self._method_list_result__groups(
-                dict(zip(row.keys(), row))
-                for row in query)  # return a generator
+                _rows_as_dicts(query))  # return a generator
 
         # Regular result: entities
         return self._method_list_result__entities(iter(query))  # Return an iterable that yields entities, not a list
@@ -250,7 +261,7 @@ class CrudViewMixin:
             instance = self._get_one(self._get_query_object(), *filter, **filter_by)
 
         # Old instance: is used to provide the _save_hook() with the previous state of the instance
-        old_instance = ModelHistoryProxy(instance)
+        old_instance = ModelHistoryProxy(instance) if self._needs_prev_instance else None
 
         # Update it
         # (wrapped with a relationship saver)
@@ -540,6 +551,19 @@ class CrudViewMixin:
     # endregion
 
 
+def _rows_as_dicts(rows: Iterable[Tuple]) -> Iterable[dict]:
+    """ Convert keyed tuples into dicts
+
+        All rows of a query share the same keys, so they're only taken from the first row.
+    """
+    rows = iter(rows)
+    for row in rows:
+        keys = row.keys()
+        yield dict(zip(keys, row))
+        for row in rows:
+            yield dict(zip(keys, row))
+
+
 class saves_relations(method_decorator):
     """ A decorator that marks a method that handles saving some related models (or any other custom values)
 
@@ -617,4 +641,3 @@ class _ABSENT_TYPE:
 
 
 ABSENT = _ABSENT_TYPE()  # A falsy marker to be used for @saves_relations
-
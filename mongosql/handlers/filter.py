@@ -99,7 +99,7 @@ from sqlalchemy.sql.functions import func
 from sqlalchemy.dialects import postgresql as pg
 from .base import MongoQueryHandlerBase
 from ..bag import CombinedBag, FakeBag
-from ..exc import InvalidQueryError, InvalidColumnError, InvalidRelationError
+from ..exc import InvalidQueryError, InvalidColumnError
 
 
 # region Filter Expression Classes
@@ -223,7 +223,8 @@ class FilterColumnExpression(FilterExpressionBase):
         Consists of: an operator ($eq, etc), a column, and a value to compare the column to
     """
 
-    __slots__ = ('bag', 'column_name', 'column', 'real_column', 'operator_lambda', 'column_expression', 'value_expression')
+    __slots__ = ('bag', 'column_name', 'column', 'real_column', 'operator_lambda', 'column_expression', 'value_expression',
+                 '_is_column_json')
 
     def __init__(self,
                  bag, column_name, column,
@@ -246,6 +247,9 @@ class FilterColumnExpression(FilterExpressionBase):
         self.real_column = column
         self.operator_lambda = operator_lambda
 
+        # is_column_json() asks the bag once, and only when it's actually needed
+        self._is_column_json = None
+
         # Make sure `real_column` contains what we expect
         if '.' in self.column_name and self.is_column_json():
             self.real_column = self.bag.get_column(column_name)  # real column, not JSON path
@@ -261,7 +265,9 @@ class FilterColumnExpression(FilterExpressionBase):
         return self.bag.is_column_array(self.column_name)
 
     def is_column_json(self):
-        return self.bag.is_column_json(self.column_name)
+        if self._is_column_json is None:
+            self._is_column_json = self.bag.is_column_json(self.column_name)
+        return self._is_column_json
 
     def is_value_array(self):
         return _is_array(self.value)
@@ -106,7 +106,7 @@ class MongoJoin(MongoQueryHandlerBase):
         if allowed_relations is not None and banned_relations is not None:
             raise ValueError('Cannot use both `allowed_relations` and `banned_relations`')
         elif allowed_relations is not None:
-            self.allowed_relations = set(allowed_relations)
+            self.allowed_relations = frozenset(allowed_relations)
         elif banned_relations is not None:
             self.allowed_relations = self.bags.relations.names - set(banned_relations)
         else:
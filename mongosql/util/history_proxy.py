@@ -1,4 +1,8 @@
 from copy import deepcopy
+from datetime import datetime, date, time, timedelta
+from decimal import Decimal
+from uuid import UUID
+
 from sqlalchemy import inspect
 from sqlalchemy.orm.base import DEFAULT_STATE_ATTR
 from sqlalchemy.orm.state import InstanceState
@@ -66,8 +70,8 @@ class ModelHistoryProxy:
                 attr_state = insp.attrs[column_name]  # type: AttributeState
 
                 # Get the historical value
-                # deepcopy() ensures JSON and ARRAY values are copied in full
-                hist_val = deepcopy(_get_historical_value(attr_state))
+                # _naive_deepcopy() ensures JSON and ARRAY values are copied in full
+                hist_val = _naive_deepcopy(_get_historical_value(attr_state))
 
                 # Remove the value onto `self`: we're bearing the value now
                 setattr(self, column_name, hist_val)
@@ -120,3 +124,28 @@ def _get_historical_value(attr):
         # It's a tuple, since History supports collections, but we do not support these,
         # so just get the first element
         return history.deleted[0]
+
+
+def _naive_deepcopy(value):
+    """ Copy a column value deep enough to isolate it from in-place modifications
+
+        Immutable values (numbers, strings, dates, ...) are returned as is.
+        Plain dicts and lists (that's what JSON and ARRAY values are made of) are copied recursively.
+        Anything else (dict subclasses like MutableDict, sets, pickled objects, ...) goes through copy.deepcopy().
+    """
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    elif value_type is dict:
+        return {k: _naive_deepcopy(v) for k, v in value.items()}
+    elif value_type is list:
+        return [_naive_deepcopy(v) for v in value]
+    else:
+        return deepcopy(value)
+
+
+# Types whose values can be shared safely: they can't be modified in-place
+_IMMUTABLE_TYPES = frozenset((
+    type(None), bool, int, float, complex, str, bytes,
+    Decimal, datetime, date, time, timedelta, UUID,
+))
@@ -1,4 +1,5 @@
 import unittest
+from unittest import mock
 
 from sqlalchemy.orm import aliased
 
@@ -79,6 +80,9 @@ class BagsTest(unittest.TestCase):
         self.assertEqual(bags.nullable.names, {'name', 'tags', 'age', 'master_id'})
         self.assertEqual(bags.properties.names, {'user_calculated'})
         self.assertEqual(bags.hybrid_properties.names, set())
+        self.assertIsInstance(bags.all_names, frozenset)
+        self.assertIs(bags.all_names, bags.all_names)
+        self.assertGreaterEqual(bags.all_names, {'id', 'user_calculated', 'roles'})
 
         #=== related_columns. Dot-notation
         bag = bags.related_columns
@@ -102,6 +106,7 @@ class BagsTest(unittest.TestCase):
         )
 
         self.assertGreaterEqual(cbag.names, {'id', 'roles.id'})
+        self.assertIsInstance(cbag.names, frozenset)  # same as every other bag
 
         self.assertIn('id', cbag)
         self.assertIn('roles.id', cbag)
@@ -114,6 +119,7 @@ class BagsTest(unittest.TestCase):
         self.assertIs(col, models.User.id)
         self.assertEqual(type(bag), DotColumnsBag)
         self.assertFalse(bag.is_column_array('id'))
+        self.assertIs(cbag['id'], cbag['id'])  # resolved only once
 
         bag_name, bag, col = cbag['tags']
         self.assertEqual(bag_name, 'col')
@@ -161,10 +167,20 @@ class BagsTest(unittest.TestCase):
         self.assertTrue('data.id' in bag)
         self.assertEqual(str(bag['data.id']), 'a.data #>> :data_1')  # SQL expression
         self.assertRaises(KeyError, bag.__getitem__, 'title.id')  # not JSON
+        self.assertRaises(KeyError, bag.__getitem__, 'title.')  # trailing dot: still not JSON
+        self.assertEqual(str(bag['data.']), 'a.data #>> :data_1')  # trailing dot: still a JSON path
+        self.assertIs(bag['data.id'], bag['data.id'])  # JSON path expressions are reused
+        with mock.patch('mongosql.bag._JSON_PATHS_CACHE_SIZE', 1):  # ... but not indefinitely
+            fresh_bag = DotColumnsBag(dict(bag))
+            self.assertIs(fresh_bag['data.a'], fresh_bag['data.a'])
+            self.assertIsNot(fresh_bag['data.b'], fresh_bag['data.b'])
+            self.assertEqual(str(fresh_bag['data.b']), 'a.data #>> :data_1')
+        self.assertEqual(bag.get_column_name('data.a.b'), 'data')
 
         # All fields validated ok
         self.assertEqual(bag.get_invalid_names(['id', 'data', 'data.rating']), set())  # JSON prop
         self.assertEqual(bag.get_invalid_names(['id.rating']), {'id.rating'})  # not JSON
+        self.assertEqual(bag.get_invalid_names(['title.']), {'title.'})  # not JSON
 
         # === association_proxies
         bag = bags.association_proxies
@@ -188,6 +204,10 @@ class BagsTest(unittest.TestCase):
         # === pk, nullable, properties, hybrid properties
         self.assertEqual(bags.pk.names, {'id'})
         self.assertEqual(bags.nullable.names, {'uid', 'title', 'theme', 'data'})
+        self.assertIn('id', bags.pk)
+        self.assertNotIn('uid', bags.pk)
+        self.assertIn('data', bags.nullable)
+        self.assertNotIn('data.id', bags.nullable)  # plain ColumnsBag: no dot-notation
         self.assertEqual(bags.properties.names, {'calculated'})
         self.assertEqual(bags.hybrid_properties.names, {'hybrid'})
 
@@ -210,6 +230,8 @@ class BagsTest(unittest.TestCase):
         self.assertTrue(bag.is_relationship_array('comments'))
 
         self.assertIs(bag.get_relationship('user.id'), models.Article.user)
+        self.assertEqual(bag.get_relationship_name('user.id'), 'user')
+        self.assertEqual(bag.get_related_column_name('user.id'), 'id')
 
         # === Combined: columns + hybrid
         cbag = CombinedBag(
@@ -231,6 +253,11 @@ class BagsTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             ModelPropertyBags(aliased(models.Article))
 
+        # Resolve a JSON path and iterate on the original model: an alias must not reuse them
+        ModelPropertyBags.for_model(models.Article).columns['data.rating']
+        list(ModelPropertyBags.for_model(models.Article).columns)
+        list(ModelPropertyBags.for_model(models.Article).relations)
+
         # Init bags
         bags = ModelPropertyBags.for_alias(aa)
 
@@ -244,6 +271,12 @@ class BagsTest(unittest.TestCase):
         self.assertIsInstance(bags.pk._columns, DictOfAliasedColumns)
         self.assertIsInstance(bags.nullable._columns, DictOfAliasedColumns)
 
+        # Names are shared with the original bags: only the columns are aliased
+        original_bags = ModelPropertyBags.for_model(models.Article)
+        self.assertIs(bags.columns._column_names, original_bags.columns._column_names)
+        self.assertIs(bags.columns._json_column_names, original_bags.columns._json_column_names)
+        self.assertIs(bags.relations._rel_names, original_bags.relations._rel_names)
+
 
         # Test every bag and make sure it returns columns of an aliased model, not the original model
         # To test this, we're compiling its `Column.expression` to string: it should refer to the aliased table.
@@ -305,6 +338,7 @@ class BagsTest(unittest.TestCase):
 
         c = bag['hybrid']
         self.assertEqual(str(c), 'AliasedClass_Article.hybrid')
+        self.assertIs(bag['hybrid'], c)  # resolved only once
         expr = str(c.expression)
         self.assertIn('a_1.id > :id_1', expr)
         self.assertIn('FROM u, a AS a_1', expr)
@@ -413,6 +447,71 @@ class BagsTest(unittest.TestCase):
         # Test that after calling aliased(), for_model() still returns unadulterated bags
         self.assertIs(ModelPropertyBags.for_model(models.Article), a)
 
+        # Test that aliases reuse the bags of their model
+        self.assertIs(ModelPropertyBags.for_model_or_alias(models.Article), a)
+        aa = ModelPropertyBags.for_model_or_alias(aliased(models.Article))
+        self.assertIs(aa.model, models.Article)
+        self.assertIsNot(aa, a)
+
+        # for_model() still does not tolerate aliases
+        with self.assertRaises(TypeError):
+            ModelPropertyBags.for_model(aliased(models.Article))
+
+        # Rarely used bags are only initialized when accessed
+        bags = ModelPropertyBags(models.Article)
+        self.assertFalse(hasattr(bags, '_writable'))
+        self.assertEqual(bags.writable.names, {'id', 'uid', 'title', 'theme', 'data', 'calculated'})
+        self.assertIs(bags.writable, bags._writable)
+
+        # Subclasses of ModelPropertyBags get bags of their own
+        class CustomModelPropertyBags(ModelPropertyBags):
+            __slots__ = ()
+
+        c = CustomModelPropertyBags.for_model(models.Article)
+        self.assertIsInstance(c, CustomModelPropertyBags)
+        self.assertIs(CustomModelPropertyBags.for_model(models.Article), c)
+        self.assertIs(ModelPropertyBags.for_model(models.Article), a)
+
+    def test_bags_follow_init_columns(self):
+        """ Test that informational bags are built from whatever _init_columns() gives """
+        class NoIdModelPropertyBags(ModelPropertyBags):
+            __slots__ = ()
+
+            def _init_columns(self, model, insp):
+                columns = super()._init_columns(model, insp)
+                return DotColumnsBag({name: col for name, col in columns if name != 'id'})
+
+        bags = NoIdModelPropertyBags.for_model(models.Article)
+        self.assertNotIn('id', bags.columns)
+        self.assertRaises(KeyError, lambda: bags.pk)  # `id` is the primary key, but it's not a column here
+
+        # Same with nullable and deferred columns
+        class NoThemeModelPropertyBags(ModelPropertyBags):
+            __slots__ = ()
+
+            def _init_columns(self, model, insp):
+                columns = super()._init_columns(model, insp)
+                return DotColumnsBag({name: col for name, col in columns if name != 'theme'})
+
+        self.assertIn('theme', ModelPropertyBags.for_model(models.Article).nullable)
+        bags = NoThemeModelPropertyBags.for_model(models.Article)
+        self.assertNotIn('theme', bags.nullable)
+        self.assertLessEqual(bags.nullable.names, bags.columns.names)
+        self.assertLessEqual(bags.deferred_columns.names, bags.columns.names)
+
+    def test_bags_use_slots(self):
+        """ Test that bags don't carry a __dict__ around """
+        bags = ModelPropertyBags.for_model(models.Article)
+        self.assertFalse(hasattr(bags, '__dict__'))
+        for bag in (bags.columns, bags.column_properties, bags.properties, bags.hybrid_properties,
+                    bags.association_proxies, bags.relations, bags.related_columns,
+                    bags.pk, bags.nullable, bags.deferred_columns, bags.writable):
+            self.assertFalse(hasattr(bag, '__dict__'), type(bag))
+
+        # Aliased bags too
+        aa = ModelPropertyBags.for_alias(aliased(models.Article))
+        self.assertFalse(hasattr(aa.columns, '__dict__'))
+
     def test_mixins_car_article(self):
         """ Test table mixins """
         # First, load Article
@@ -1,5 +1,6 @@
 
 import unittest
+from unittest import mock
 from typing import Callable
 
 from flask import Flask, g
@@ -9,6 +10,8 @@ from sqlalchemy.orm.exc import NoResultFound
 from . import models
 from .crud_view import ArticleView, GirlWatcherView
 from mongosql import StrictCrudHelper, StrictCrudHelperSettingsDict, saves_relations, ABSENT
+from mongosql import CrudViewMixin, CrudHelper
+from mongosql.util.history_proxy import ModelHistoryProxy
 
 
 class CrudTestBase(unittest.TestCase):
@@ -428,6 +431,17 @@ class ArticleViewTest(CrudTestBase):
             }).get_json()
             self.assertEqual(rv['article']['title'], '10'+'!!! :)')
 
+        # Test: JSON merge into a NULL value
+        article = models.Article(id=1000, data=None)
+        ArticleView.crudhelper.update_model({'data': {'a': 1}}, article)
+        self.assertEqual(article.data, {'a': 1})
+
+        # Test: JSON merge does not modify the previous value in-place
+        prev_data = article.data
+        ArticleView.crudhelper.update_model({'data': {'b': 2}}, article)
+        self.assertEqual(article.data, {'a': 1, 'b': 2})
+        self.assertEqual(prev_data, {'a': 1})
+
     def test_delete(self):
         """ Test delete() """
 
@@ -640,6 +654,52 @@ class ArticleViewTest(CrudTestBase):
             {d.method_name for d in decorators}
         )
 
+    def test_update_prev_instance(self):
+        """ Test: _save_hook() gets the previous instance only when something can use it """
+        db = self.db
+        save_hook_calls = []
+
+        class TestView(CrudViewMixin):
+            crudhelper = CrudHelper(models.Article)
+
+            def _get_db_session(self):
+                return db
+
+            def _get_query_object(self):
+                return {}
+
+        # A view with a custom hook: gets a ModelHistoryProxy
+        class HookView(TestView):
+            def _save_hook(self, new, prev=None):
+                save_hook_calls.append(prev)
+
+        instance = HookView()._method_update({'title': 'updated'}, id=10)
+        self.assertEqual(instance.title, 'updated')
+        prev, = save_hook_calls
+        self.assertIsInstance(prev, ModelHistoryProxy)
+        self.assertEqual(prev.title, '10')
+
+        # A view with @saves_relations: gets a ModelHistoryProxy as well
+        class RelationsView(TestView):
+            @saves_relations('a')
+            def save_a(self, new, prev=None, a=None):
+                pass
+
+        save_hook_calls.clear()
+        with mock.patch.object(RelationsView, '_save_hook', lambda self, new, prev=None: save_hook_calls.append(prev)):
+            RelationsView()._method_update({'title': 'again'}, id=10)
+        prev, = save_hook_calls
+        self.assertIsInstance(prev, ModelHistoryProxy)
+
+        # A bare view: nothing to give the previous instance to
+        class BareView(TestView):
+            pass
+
+        save_hook_calls.clear()
+        with mock.patch.object(BareView, '_save_hook', lambda self, new, prev=None: save_hook_calls.append(prev)):
+            BareView()._method_update({'title': 'once more'}, id=10)
+        self.assertEqual(save_hook_calls, [None])
+
 
 class GirlWatcherViewTest(CrudTestBase):
     """ Test GirlWatcherView """
@@ -3,7 +3,9 @@ from sqlalchemy.orm import load_only, lazyload
 
 from . import models
 from .util import ExpectedQueryCounter
-from mongosql.util.history_proxy import ModelHistoryProxy
+from sqlalchemy.ext.mutable import MutableDict
+
+from mongosql.util.history_proxy import ModelHistoryProxy, _naive_deepcopy
 
 
 class HistoryTest(unittest.TestCase):
@@ -237,3 +239,26 @@ class HistoryTest(unittest.TestCase):
 
         # Undo
         ssn.close()
+
+    def test_naive_deepcopy(self):
+        # Immutable values are shared
+        s = 'a' * 100
+        self.assertIs(_naive_deepcopy(s), s)
+
+        # Plain dicts and lists are copied all the way down
+        v = {'a': [1, {'b': 2}]}
+        copied = _naive_deepcopy(v)
+        self.assertEqual(copied, v)
+        self.assertIsNot(copied['a'], v['a'])
+        self.assertIsNot(copied['a'][1], v['a'][1])
+
+        # Everything else goes through deepcopy(): types are preserved, nothing is shared
+        v = MutableDict({'a': {'b': 1}})
+        copied = _naive_deepcopy(v)
+        self.assertIsInstance(copied, MutableDict)
+        self.assertIsNot(copied['a'], v['a'])
+
+        v = {'s': {1, 2}}
+        copied = _naive_deepcopy(v)
+        self.assertEqual(copied, v)
+        self.assertIsNot(copied['s'], v['s'])